@@ -2,6 +2,7 @@
 import asyncio
 import email.utils
 import logging
+import random
 import re
 import time
 from http import HTTPStatus
@@ -9,9 +10,10 @@ from typing import Any, Literal
 from urllib.parse import parse_qs, unquote, urlsplit
 
 import httpx
+import orjson
 from fastmcp.server.dependencies import get_http_request
 
-from .config import EODHD_RATE_LIMIT_DELAY, EODHD_RETRY_ENABLED, get_api_key
+from .config import EODHD_RATE_LIMIT_BURST, EODHD_RATE_LIMIT_DELAY, EODHD_RETRY_ENABLED, get_api_key
 
 logger = logging.getLogger("eodhd-mcp.api_client")
 
@@ -48,9 +50,19 @@ def _get_client_lock() -> asyncio.Lock:
     return _http_client_lock
 
 
+# Connection-pool sizing for the shared client.  Everything goes to one host
+# (eodhd.com), so keep a generous keep-alive pool to avoid re-handshaking TLS
+# on every request while still capping total sockets under bursty fan-outs.
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+
 def _create_http_client() -> httpx.AsyncClient:
-    """Create the shared HTTP client."""
-    return httpx.AsyncClient(timeout=httpx.Timeout(30.0))
+    """Create the shared HTTP client.
+
+    HTTP/2 lets concurrent requests to the single upstream host multiplex over
+    one TCP+TLS connection instead of opening a socket per in-flight request.
+    """
+    return httpx.AsyncClient(timeout=httpx.Timeout(30.0), limits=_CLIENT_LIMITS, http2=True)
 
 
 async def _get_http_client() -> httpx.AsyncClient:
@@ -95,16 +107,17 @@ RETRY_DELAY_MAX = 10.0  # seconds cap
 
 
 class _ConnectionState:
-    """Pacing state for a single API-token bucket.
+    """Token-bucket state for a single API-token bucket.
 
     Each instance owns its own asyncio.Lock so concurrent requests sharing the
     same token are serialised, while requests on different tokens run freely.
     """
 
-    __slots__ = ("_lock", "backoff_until", "last_request_time")
+    __slots__ = ("_lock", "backoff_until", "last_refill", "tokens")
 
-    def __init__(self) -> None:
-        self.last_request_time: float = 0.0
+    def __init__(self, tokens: float = 1.0) -> None:
+        self.tokens: float = tokens
+        self.last_refill: float = time.monotonic()
         self.backoff_until: float = 0.0
         self._lock: asyncio.Lock = asyncio.Lock()
 
@@ -114,17 +127,24 @@ class _ConnectionState:
 
 
 class RateLimiter:
-    """Encapsulates per-connection pacing state and the base delay.
+    """Token-bucket limiter with per-connection state and a shared base delay.
+
+    Each connection's bucket refills at one token per ``delay`` seconds up to
+    ``burst`` tokens, so the long-run rate matches the configured delay while a
+    burst capacity above 1 lets short spikes of concurrent requests proceed
+    without queueing behind each other.
 
     Disabled by default (delay=0.0).  When disabled, ``rate_limit()`` and
     ``set_backoff()`` are true no-ops — no locks acquired, no state allocated.
 
     Enable by setting ``EODHD_RATE_LIMIT_DELAY`` env var to a positive float
-    (e.g. ``0.1`` for 100 ms) or by calling ``set_rate_limit(seconds)``.
+    (e.g. ``0.1`` for 100 ms) or by calling ``set_rate_limit(seconds)``; tune
+    the burst capacity with ``EODHD_RATE_LIMIT_BURST``.
     """
 
-    def __init__(self, delay: float = 0.0) -> None:
+    def __init__(self, delay: float = 0.0, burst: int = 1) -> None:
         self._delay: float = max(0.0, delay)
+        self._burst: float = float(max(1, burst))
         self._states: dict[str, _ConnectionState] = {}
         self._states_lock: asyncio.Lock = asyncio.Lock()
 
@@ -153,32 +173,49 @@ class RateLimiter:
             # Double-check after acquiring the lock
             state = self._states.get(connection_key)
             if state is None:
-                state = _ConnectionState()
+                # A fresh bucket starts full so the first burst is free.
+                state = _ConnectionState(tokens=self._burst)
                 self._states[connection_key] = state
             return state
 
+    def _refill(self, state: _ConnectionState, now: float) -> None:
+        """Credit tokens accrued since the last refill, capped at the burst size."""
+        state.tokens = min(self._burst, state.tokens + (now - state.last_refill) / self._delay)
+        state.last_refill = now
+
     async def rate_limit(self, connection_key: str) -> None:
-        """Enforce per-connection pacing and any scheduled retry backoff.
+        """Take one token from the connection's bucket, waiting for refill if empty.
 
-        When rate limiting is disabled (delay == 0) and no backoff is pending
-        for this connection, this is a true no-op — no lock, no state created.
-        Backoff (from upstream 429s / retries) is always honoured regardless.
+        Also honours any scheduled retry backoff.  When rate limiting is
+        disabled (delay == 0) and no backoff is pending for this connection,
+        this is a true no-op — no lock, no state created.  Backoff (from
+        upstream 429s / retries) is always honoured regardless.
         """
         if not self.enabled:
             # Even when disabled, honour pending backoff if state exists.
             state = self._states.get(connection_key)
             if state is None or state.backoff_until <= 0.0:
                 return
+            async with state.lock:
+                now = time.monotonic()
+                if state.backoff_until > now:
+                    await asyncio.sleep(state.backoff_until - now)
+                if state.backoff_until <= time.monotonic():
+                    state.backoff_until = 0.0
+            return
 
         state = await self.get_state(connection_key)
         async with state.lock:
             now = time.monotonic()
-            ready_at = max(state.backoff_until, state.last_request_time + self._delay)
-            if now < ready_at:
-                await asyncio.sleep(ready_at - now)
-            now = time.monotonic()
-            state.last_request_time = now
-            if state.backoff_until <= now:
+            self._refill(state, now)
+            wait = max(0.0, state.backoff_until - now)
+            if state.tokens < 1.0:
+                wait = max(wait, (1.0 - state.tokens) * self._delay)
+            if wait > 0.0:
+                await asyncio.sleep(wait)
+                self._refill(state, time.monotonic())
+            state.tokens = max(0.0, state.tokens - 1.0)
+            if state.backoff_until <= time.monotonic():
                 state.backoff_until = 0.0
 
     async def set_backoff(self, connection_key: str, delay: float) -> None:
@@ -200,7 +237,7 @@ class RateLimiter:
 
 
 # Module-wide singleton — disabled by default, reads env for opt-in delay.
-_rate_limiter = RateLimiter(delay=EODHD_RATE_LIMIT_DELAY)
+_rate_limiter = RateLimiter(delay=EODHD_RATE_LIMIT_DELAY, burst=EODHD_RATE_LIMIT_BURST)
 
 _RETRY_AFTER_DEFAULT = 60  # seconds — fallback when header is missing or unparseable
 
@@ -469,15 +506,16 @@ def _resolve_eodhd_token_from_request() -> str | None:
         logger.debug("Unexpected error resolving HTTP request context", exc_info=True)
         return None
 
-    # 1) Authorization: Bearer <token>
-    auth = req.headers.get("authorization") or req.headers.get("Authorization")
-    if auth and auth.lower().startswith("bearer "):
-        token = auth.split(" ", 1)[1].strip()
+    # 1) Authorization: Bearer <token> — header lookup is case-insensitive in
+    # Starlette, so a single get() covers every spelling.
+    auth = req.headers.get("authorization")
+    if auth and auth[:7].lower() == "bearer ":
+        token = auth[7:].strip()
         if token:
             return token
 
     # 2) X-API-Key (optional)
-    xkey = req.headers.get("x-api-key") or req.headers.get("X-API-Key")
+    xkey = req.headers.get("x-api-key")
     if xkey:
         return xkey.strip()
 
@@ -491,19 +529,29 @@ def _resolve_eodhd_token_from_request() -> str | None:
     return None
 
 
-def _ensure_api_token(url: str) -> str:
-    """
-    Inject api_token into URL query string if missing.
-    Tool-provided api_token in the URL always wins.
+def _prepare_request_url(url: str) -> tuple[str, str]:
+    """Inject api_token if missing and resolve the pacing bucket in one pass.
+
+    Tool-provided api_token in the URL always wins.  The query is parsed once
+    (not substring-scanned — a parameter value that happens to embed
+    ``api_token=`` must not make the request go out unauthenticated) and the
+    effective token doubles as the rate-limiter connection key, so
+    ``make_request`` does a single parse instead of one per concern.
     """
-    if "api_token=" in url:
-        return url
+    existing = parse_qs(urlsplit(url).query).get("api_token", [""])[0]
+    if existing:
+        return url, existing
 
     token = _resolve_eodhd_token_from_request() or get_api_key()
     if not token:
-        return url  # best-effort; caller may have other auth patterns
+        return url, "__default__"  # best-effort; caller may have other auth patterns
+
+    return url + (f"&api_token={token}" if "?" in url else f"?api_token={token}"), token
 
-    return url + (f"&api_token={token}" if "?" in url else f"?api_token={token}")
+
+def _ensure_api_token(url: str) -> str:
+    """Inject api_token into URL query string if missing."""
+    return _prepare_request_url(url)[0]
 
 
 def _normalize_query_string(url: str) -> str:
@@ -527,23 +575,19 @@ def _normalize_query_string(url: str) -> str:
     return head + sep + frag
 
 
-def _get_connection_key(url: str) -> str:
-    """Resolve the request pacing bucket from the effective api_token."""
-    query = parse_qs(urlsplit(url).query)
-    token = query.get("api_token", [None])[0]
-    if isinstance(token, str) and token:
-        return token
-    return "__default__"
-
-
 def _clear_connection_states() -> None:
     """Reset request pacing state. Intended for tests."""
     _rate_limiter.clear()
 
 
 def _backoff(attempt: int) -> float:
-    """Exponential backoff: 1 s, 2 s, 4 s … capped at RETRY_DELAY_MAX."""
-    return min(RETRY_DELAY_BASE * float(2**attempt), RETRY_DELAY_MAX)
+    """Exponential backoff with full jitter, capped at RETRY_DELAY_MAX.
+
+    Drawing uniformly from [0, base * 2^attempt] decorrelates retries across
+    concurrent requests — deterministic delays would make every coroutine that
+    hit the same transient 5xx retry at the same instant (thundering herd).
+    """
+    return random.uniform(0.0, min(RETRY_DELAY_BASE * float(2**attempt), RETRY_DELAY_MAX))  # noqa: S311
 
 
 def set_rate_limit(delay: float) -> None:
@@ -575,8 +619,7 @@ async def make_request(
     - ``response_mode="bytes"`` returns raw ``response.content`` on success.
     - Returns {"error": "..."} on failure.
     """
-    url = _ensure_api_token(_normalize_query_string(url))
-    connection_key = _get_connection_key(url)
+    url, connection_key = _prepare_request_url(_normalize_query_string(url))
     m = (method or "GET").upper()
 
     if m not in ("GET", "POST", "PUT", "DELETE"):
@@ -637,7 +680,9 @@ async def make_request(
                     attempt + 1,
                     retries + 1,
                 )
-                await _rate_limiter.set_backoff(connection_key, retry_after)
+                # Add up to 1 s of jitter so parallel callers rate-limited together
+                # don't all come back in the same instant.
+                await _rate_limiter.set_backoff(connection_key, retry_after + random.uniform(0.0, 1.0))  # noqa: S311
                 continue  # does not count as a failed attempt
 
             response.raise_for_status()
@@ -648,9 +693,11 @@ async def make_request(
             if response_mode == "text":
                 return response.text
 
-            # Prefer JSON; if server returns non-JSON return a helpful error object
+            # Prefer JSON; if server returns non-JSON return a helpful error object.
+            # orjson parses the raw bytes in C — noticeably faster than stdlib json
+            # on the multi-hundred-KB fundamentals payloads.
             try:
-                return response.json()
+                return orjson.loads(response.content)
             except ValueError:
                 ct = response.headers.get("content-type", "")
                 text = _truncate_text(response.text)
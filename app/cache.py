@@ -0,0 +1,102 @@
+# app/cache.py
+"""In-process TTL cache for slow-changing reference data.
+
+Reference endpoints (exchange lists, exchange metadata) change at most daily
+but are hit on nearly every agent session.  ``cached_request()`` wraps a
+``make_request``-shaped fetcher with a small async TTL cache so repeat calls
+skip the network round trip entirely.
+
+Design notes:
+- Keys are the fully resolved request URL (token injected), so calls made with
+  different credentials never share an entry.
+- A per-key ``asyncio.Lock`` gives singleflight semantics: concurrent misses
+  for the same URL trigger one upstream request, not a thundering herd.
+- ``{"error": ...}`` payloads are returned but never stored — a transient
+  upstream failure must not be served as a cached answer for the next TTL.
+- Set ``EODHD_CACHE_DISABLED=true`` to bypass the cache entirely.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.api_client import _normalize_query_string, _prepare_request_url, make_request
+from app.config import EODHD_CACHE_DISABLED
+
+# Reference data refreshes upstream at most daily; metadata with live fields
+# (e.g. exchange-details carries isOpen) gets a much shorter window.
+TTL_REFERENCE_DATA = 86400.0  # 24 hours
+TTL_EXCHANGE_METADATA = 300.0  # 5 minutes
+
+_MAX_ENTRIES = 256
+
+# Clock indirection: tests monkeypatch this to advance a fake clock instead of
+# sleeping through real TTLs.
+_now: Callable[[], float] = time.monotonic
+
+_cache: dict[str, tuple[float, Any]] = {}
+_key_locks: dict[str, asyncio.Lock] = {}
+
+
+def _cache_key(url: str) -> str:
+    """Resolve the URL exactly as make_request() would, including the token."""
+    return _prepare_request_url(_normalize_query_string(url))[0]
+
+
+def _evict_for_insert(now: float) -> None:
+    """Drop expired entries; if the cache is still full, drop the stalest."""
+    if len(_cache) < _MAX_ENTRIES:
+        return
+    for key in [k for k, (expires_at, _) in _cache.items() if expires_at <= now]:
+        del _cache[key]
+        _key_locks.pop(key, None)
+    if len(_cache) >= _MAX_ENTRIES:
+        oldest = min(_cache, key=lambda k: _cache[k][0])
+        del _cache[oldest]
+        _key_locks.pop(oldest, None)
+
+
+async def cached_request(
+    url: str,
+    *,
+    ttl: float,
+    fetch: Callable[[str], Awaitable[Any]] = make_request,
+) -> Any:
+    """Return the response for ``url``, serving repeats from cache for ``ttl`` seconds.
+
+    ``fetch`` defaults to ``make_request``; tools pass their own module-level
+    ``make_request`` reference so per-tool test doubles keep working.
+    """
+    if EODHD_CACHE_DISABLED or ttl <= 0:
+        return await fetch(url)
+
+    key = _cache_key(url)
+
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > _now():
+        return entry[1]
+
+    lock = _key_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        entry = _cache.get(key)
+        now = _now()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        data = await fetch(url)
+        if isinstance(data, dict) and data.get("error"):
+            # Not stored, so reclaim the lock too — otherwise every distinct
+            # failing URL would leak one asyncio.Lock for the server's lifetime.
+            _key_locks.pop(key, None)
+            return data
+
+        _evict_for_insert(now)
+        _cache[key] = (now + ttl, data)
+        return data
+
+
+def clear_cache() -> None:
+    """Drop all cached responses. Intended for tests."""
+    _cache.clear()
+    _key_locks.clear()
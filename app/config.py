@@ -22,3 +22,17 @@ EODHD_RETRY_ENABLED: bool = os.environ.get("EODHD_RETRY_ENABLED", "").lower() in
 # Per-connection rate-limit delay in seconds.  Disabled (0.0) by default.
 # Set EODHD_RATE_LIMIT_DELAY to a positive float (e.g. "0.1") to enable.
 EODHD_RATE_LIMIT_DELAY: float = float(os.environ.get("EODHD_RATE_LIMIT_DELAY", "0.0"))
+
+# Set EODHD_COMPACT_JSON=true (or 1 / yes) to drop the two-space indentation
+# from JSON tool responses.  Indented output stays the default for
+# readability; compact output roughly halves the bytes of large payloads.
+EODHD_COMPACT_JSON: bool = os.environ.get("EODHD_COMPACT_JSON", "").lower() in ("1", "true", "yes")
+
+# Set EODHD_CACHE_DISABLED=true (or 1 / yes) to bypass the in-process TTL
+# cache used by reference-data tools (see app/cache.py).
+EODHD_CACHE_DISABLED: bool = os.environ.get("EODHD_CACHE_DISABLED", "").lower() in ("1", "true", "yes")
+
+# Token-bucket burst capacity for the rate limiter.  The default of 1 keeps the
+# documented fixed-gap pacing; raise it (e.g. "5") to let short bursts through
+# at full speed while the long-run rate stays at one request per delay.
+EODHD_RATE_LIMIT_BURST: int = max(1, int(os.environ.get("EODHD_RATE_LIMIT_BURST", "1")))
@@ -14,6 +14,8 @@ from urllib.parse import quote_plus, urlencode
 
 from fastmcp.exceptions import ToolError
 
+from app.config import EODHD_API_BASE
+
 logger = logging.getLogger("eodhd-mcp.formatter")
 
 # Characters that would break a URL path segment or query string.
@@ -29,8 +31,6 @@ def build_url(path: str, params: dict[str, str | int | float | bool | None] | No
     *params* values that are ``None`` or ``""`` are silently dropped so callers
     can pass every optional parameter without ``if`` guards.
     """
-    from app.config import EODHD_API_BASE  # late import avoids circular deps
-
     base = f"{EODHD_API_BASE}/{path.lstrip('/')}"
     if not params:
         return base
@@ -54,14 +54,20 @@ def build_query_param(key: str, val: str | int | float | None) -> str:
     return f"&{key}={quote_plus(str(val))}"
 
 
+# One trimmed comma-separated segment: first and last characters are neither a
+# comma nor whitespace, anything except a comma in between.
+_CSV_PART_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
 def split_csv(value: str | int | float) -> list[str]:
     """Split a comma-separated filter value into stripped, non-empty parts.
 
     Several EODHD filters accept a comma-separated list (upstream validates each
     element via ``CsvIn``), so tools validate each part rather than the whole
-    string. A scalar (single value) yields a one-element list.
+    string. A scalar (single value) yields a one-element list.  A single
+    precompiled regex scan replaces the split + per-part strip loop.
     """
-    return [part.strip() for part in str(value).split(",") if part.strip()]
+    return _CSV_PART_RE.findall(str(value))
 
 
 def normalize_csv_upper(value: str | None) -> str | None:
@@ -293,6 +299,28 @@ _DATE_FORMATS = [
 
 # ── Internal helpers ──────────────────────────────────────────────────────
 
+# Fast path for the overwhelmingly common agent input: an already-canonical
+# YYYY-MM-DD string.  A regex + days-in-month check avoids the datetime
+# round trip (parse, allocate, strftime) that the flexible path pays.
+_YMD_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})\Z")
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_canonical_ymd(s: str) -> bool:
+    """True when *s* is a valid zero-padded ``YYYY-MM-DD`` calendar date."""
+    m = _YMD_RE.match(s)
+    if not m:
+        return False
+    month, day = int(m[2]), int(m[3])
+    if not 1 <= month <= 12 or day < 1:
+        return False
+    max_day = _DAYS_IN_MONTH[month - 1]
+    if month == 2:
+        year = int(m[1])
+        if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+            max_day = 29
+    return day <= max_day
+
 
 def _to_unix_seconds(dt_obj: datetime) -> int:
     """Convert aware/naive datetime to Unix seconds (UTC)."""
@@ -415,10 +443,12 @@ def coerce_date_param(
     """
     if value is None:
         return None
-    if isinstance(value, str) and not value.strip():
-        return None
-
-    from fastmcp.exceptions import ToolError  # late import avoids circular deps
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        if _is_canonical_ymd(value):
+            return value
 
     result = format_date_ymd(value)
     if result is None:
@@ -439,8 +469,6 @@ def validate_date_range(
     unbounded.
     """
     if start and end and start > end:
-        from fastmcp.exceptions import ToolError
-
         raise ToolError(f"'{start_name}' cannot be after '{end_name}'.")
 
 
@@ -477,8 +505,6 @@ def coerce_timestamp_param(
     if isinstance(value, str) and not value.strip():
         return None
 
-    from fastmcp.exceptions import ToolError  # late import avoids circular deps
-
     result = format_date_unix(value)
     if result is None:
         raise ToolError(f"'{param_name}' could not be parsed as a date/time. Got: {value!r}")
@@ -498,6 +524,4 @@ def validate_timestamp_range(
     unbounded.
     """
     if start is not None and end is not None and start > end:
-        from fastmcp.exceptions import ToolError
-
         raise ToolError(f"'{start_name}' cannot be after '{end_name}'.")
@@ -12,11 +12,18 @@ import json
 import re
 from typing import Any
 
+import orjson
 from fastmcp.exceptions import ToolError
 from mcp.types import BlobResourceContents, EmbeddedResource, TextResourceContents
 from pydantic import AnyUrl
 
+from app.config import EODHD_COMPACT_JSON
+
 ResourceResponse = list[EmbeddedResource]
+
+# Two-space indentation by default; EODHD_COMPACT_JSON=true switches to compact
+# output, which roughly halves the bytes of large payloads on the wire.
+_JSON_OPTS = 0 if EODHD_COMPACT_JSON else orjson.OPT_INDENT_2
 JsonResponse = ResourceResponse
 
 # Zero-width spaces, bidi overrides, word joiners, BOM, and similar invisible
@@ -179,7 +186,8 @@ def format_json_response(data: Any, *, resource_path: str = "response") -> JsonR
             resource=TextResourceContents(
                 uri=_resource_uri(resource_path),
                 mimeType="application/json",
-                text=json.dumps(sanitized, indent=2),
+                # orjson serializes in C (~5x faster than stdlib on large payloads)
+                text=orjson.dumps(sanitized, option=_JSON_OPTS).decode(),
             ),
         )
     ]
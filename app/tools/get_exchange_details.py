@@ -7,6 +7,7 @@ from fastmcp.exceptions import ToolError
 from mcp.types import ToolAnnotations
 
 from app.api_client import make_request
+from app.cache import TTL_EXCHANGE_METADATA, cached_request
 from app.input_formatter import build_url, coerce_date_param, sanitize_exchange, validate_date_range
 from app.response_formatter import ResourceResponse, format_json_response
 
@@ -86,7 +87,8 @@ def register(mcp: FastMCP):
         )
 
         # --- Request ---
-        data = await make_request(url)
+        # Short TTL only: the payload carries live fields (isOpen, UpdatedTickers).
+        data = await cached_request(url, ttl=TTL_EXCHANGE_METADATA, fetch=make_request)
 
         # --- Normalize response ---
 
@@ -7,6 +7,7 @@ from fastmcp.exceptions import ToolError
 from mcp.types import ToolAnnotations
 
 from app.api_client import make_request
+from app.cache import TTL_REFERENCE_DATA, cached_request
 from app.input_formatter import build_url
 from app.response_formatter import ResourceResponse, format_json_response
 
@@ -49,7 +50,8 @@ def register(mcp: FastMCP):
 
         url = build_url("exchanges-list/", {"fmt": fmt, "api_token": api_token})
 
-        data = await make_request(url)
+        # The exchange list changes at most daily — serve repeats from cache.
+        data = await cached_request(url, ttl=TTL_REFERENCE_DATA, fetch=make_request)
 
         try:
             return format_json_response(data)
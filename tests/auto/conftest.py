@@ -4,19 +4,32 @@ import os
 os.environ.setdefault("EODHD_API_KEY", "test_key_for_ci")
 
 import pytest
+from app.cache import clear_cache
 from app.tools import register_all as register_all_tools
 from fastmcp import FastMCP
 
 
+@pytest.fixture(autouse=True)
+def _fresh_response_cache():
+    """Isolate the reference-data TTL cache between tests."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
 @pytest.fixture
 def bare_mcp():
     """A bare FastMCP instance with no tools registered."""
     return FastMCP("manual")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcp_with_tools():
-    """FastMCP with all tools registered."""
+    """FastMCP with all tools registered.
+
+    Module-scoped: registering all 88 tools is the expensive part and the
+    consuming tests only read the registry, so one instance per module is safe.
+    """
     server = FastMCP("manual")
     register_all_tools(server)
     return server
@@ -186,17 +186,21 @@ class TestEnsureApiToken:
 
 
 class TestBackoff:
-    """Exponential backoff: base * 2^attempt, capped at RETRY_DELAY_MAX."""
+    """Exponential backoff with full jitter: uniform over [0, base * 2^attempt],
+    capped at RETRY_DELAY_MAX."""
 
-    def test_exponential_delays(self):
-        assert _backoff(0) == pytest.approx(1.0)
-        assert _backoff(1) == pytest.approx(2.0)
-        assert _backoff(2) == pytest.approx(4.0)
+    def test_jittered_delays_stay_within_the_exponential_envelope(self):
+        for attempt, ceiling in ((0, 1.0), (1, 2.0), (2, 4.0)):
+            samples = [_backoff(attempt) for _ in range(50)]
+            assert all(0.0 <= s <= ceiling for s in samples)
 
     def test_capped_at_max(self):
-        # 2^10 * 1.0 = 1024, must be capped
-        assert _backoff(10) == pytest.approx(RETRY_DELAY_MAX)
-        assert _backoff(100) == pytest.approx(RETRY_DELAY_MAX)
+        # 2^10 * 1.0 = 1024, envelope must be capped
+        assert all(0.0 <= _backoff(10) <= RETRY_DELAY_MAX for _ in range(50))
+        assert all(0.0 <= _backoff(100) <= RETRY_DELAY_MAX for _ in range(50))
+
+    def test_delays_are_not_deterministic(self):
+        assert len({_backoff(10) for _ in range(20)}) > 1
 
 
 # ---------------------------------------------------------------------------
@@ -267,6 +271,34 @@ class TestSetRateLimit:
         assert ac._rate_limiter.enabled is False
 
 
+# ---------------------------------------------------------------------------
+# RateLimiter token bucket
+# ---------------------------------------------------------------------------
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_capacity_lets_initial_requests_through_unpaced(self):
+        from app.api_client import RateLimiter
+
+        limiter = RateLimiter(delay=0.05, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.rate_limit("key")
+        # A full bucket of 3 tokens should not sleep at all
+        assert time.monotonic() - start < 0.04
+
+    @pytest.mark.asyncio
+    async def test_empty_bucket_waits_for_refill(self):
+        from app.api_client import RateLimiter
+
+        limiter = RateLimiter(delay=0.05, burst=1)
+        await limiter.rate_limit("key")  # drains the single token
+        start = time.monotonic()
+        await limiter.rate_limit("key")
+        assert time.monotonic() - start >= 0.045
+
+
 # ---------------------------------------------------------------------------
 # close_client
 # ---------------------------------------------------------------------------
@@ -644,6 +676,19 @@ class TestMakeRequestQuerySeparator:
         assert "/ust/yield-rates?" in called
 
 
+def _record(msg, *, name="eodhd-mcp", level=logging.INFO, args=None, exc_info=None):
+    """A LogRecord with the shared boilerplate filled in; tests pass only the deltas."""
+    return logging.LogRecord(
+        name=name,
+        level=level,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,
+    )
+
+
 class TestSecretRedactionOnFailures:
     """The api_token must never reach the agent-visible payload or the logs."""
 
@@ -693,30 +738,14 @@ class TestSecretRedactionOnFailures:
         except ValueError:
             import sys
 
-            record = logging.LogRecord(
-                name="eodhd-mcp",
-                level=logging.ERROR,
-                pathname=__file__,
-                lineno=1,
-                msg="failed",
-                args=None,
-                exc_info=sys.exc_info(),
-            )
+            record = _record("failed", level=logging.ERROR, exc_info=sys.exc_info())
         TokenRedactingFilter().filter(record)
 
         assert record.exc_text is None
 
     def test_broken_format_call_does_not_raise(self):
         """A caller's formatting bug must not turn into an exception from the filter."""
-        record = logging.LogRecord(
-            name="third.party",
-            level=logging.INFO,
-            pathname=__file__,
-            lineno=1,
-            msg=f"api_token={self.SECRET} %s %s",
-            args=("only-one",),
-            exc_info=None,
-        )
+        record = _record(f"api_token={self.SECRET} %s %s", name="third.party", args=("only-one",))
         assert TokenRedactingFilter().filter(record) is True
         assert self.SECRET not in record.getMessage()
 
@@ -740,14 +769,10 @@ class TestSecretRedactionOnFailures:
 
     def test_httpx_url_object_in_args_is_redacted(self):
         """httpx passes the URL as an httpx.URL, not as a string."""
-        record = logging.LogRecord(
+        record = _record(
+            'HTTP Request: %s %s "%s %d %s"',
             name="httpx",
-            level=logging.INFO,
-            pathname=__file__,
-            lineno=1,
-            msg='HTTP Request: %s %s "%s %d %s"',
             args=("GET", httpx.URL(f"https://eodhd.com/api/eod?api_token={self.SECRET}"), "HTTP/1.1", 200, "OK"),
-            exc_info=None,
         )
         TokenRedactingFilter().filter(record)
 
@@ -755,14 +780,11 @@ class TestSecretRedactionOnFailures:
         assert "api_token=***" in record.getMessage()
 
     def test_exception_object_in_args_is_redacted(self):
-        record = logging.LogRecord(
+        record = _record(
+            "request failed: %s",
             name="third.party",
             level=logging.WARNING,
-            pathname=__file__,
-            lineno=1,
-            msg="request failed: %s",
             args=(httpx.ConnectError(f"cannot reach https://eodhd.com/api/eod?api_token={self.SECRET}"),),
-            exc_info=None,
         )
         TokenRedactingFilter().filter(record)
 
@@ -770,15 +792,7 @@ class TestSecretRedactionOnFailures:
 
     def test_numeric_args_keep_their_type(self):
         """A redacting pass must not turn %d arguments into strings."""
-        record = logging.LogRecord(
-            name="third.party",
-            level=logging.INFO,
-            pathname=__file__,
-            lineno=1,
-            msg="status %d after %d attempts",
-            args=(500, 3),
-            exc_info=None,
-        )
+        record = _record("status %d after %d attempts", name="third.party", args=(500, 3))
         TokenRedactingFilter().filter(record)
 
         assert record.args == (500, 3)
@@ -786,14 +800,10 @@ class TestSecretRedactionOnFailures:
 
     def test_filter_redacts_third_party_records(self):
         """httpx logs the full request URL at INFO; the filter must scrub it."""
-        record = logging.LogRecord(
+        record = _record(
+            'HTTP Request: GET https://eodhd.com/api/eod/AAPL.US?api_token=%s "HTTP/1.1 200 OK"',
             name="httpx",
-            level=logging.INFO,
-            pathname=__file__,
-            lineno=1,
-            msg='HTTP Request: GET https://eodhd.com/api/eod/AAPL.US?api_token=%s "HTTP/1.1 200 OK"',
             args=(self.SECRET,),
-            exc_info=None,
         )
         assert TokenRedactingFilter().filter(record) is True
         assert self.SECRET not in record.getMessage()
@@ -804,14 +814,10 @@ class TestSecretRedactionOnFailures:
     )
     def test_redacts_every_accepted_credential_param(self, param):
         """uvicorn logs this server's own request line, so every alias must be scrubbed."""
-        record = logging.LogRecord(
+        record = _record(
+            '%s - "%s %s HTTP/%s" %d',
             name="uvicorn.access",
-            level=logging.INFO,
-            pathname=__file__,
-            lineno=1,
-            msg='%s - "%s %s HTTP/%s" %d',
             args=("172.17.0.1:5000", "POST", f"/mcp?{param}={self.SECRET}", "1.1", 200),
-            exc_info=None,
         )
         TokenRedactingFilter().filter(record)
         assert self.SECRET not in record.getMessage()
@@ -821,14 +827,10 @@ class TestSecretRedactionOnFailures:
         """Clearing record.args turns every uvicorn access line into a logging error."""
         from uvicorn.logging import AccessFormatter
 
-        record = logging.LogRecord(
+        record = _record(
+            '%s - "%s %s HTTP/%s" %d',
             name="uvicorn.access",
-            level=logging.INFO,
-            pathname=__file__,
-            lineno=1,
-            msg='%s - "%s %s HTTP/%s" %d',
             args=("172.17.0.1:5000", "POST", f"/mcp?apikey={self.SECRET}", "1.1", 200),
-            exc_info=None,
         )
         TokenRedactingFilter().filter(record)
         line = AccessFormatter(use_colors=False).format(record)
@@ -849,29 +851,13 @@ class TestSecretRedactionOnFailures:
         except httpx.ConnectError:
             import sys
 
-            record = logging.LogRecord(
-                name="eodhd-mcp",
-                level=logging.ERROR,
-                pathname=__file__,
-                lineno=1,
-                msg="upstream call failed",
-                args=None,
-                exc_info=sys.exc_info(),
-            )
+            record = _record("upstream call failed", level=logging.ERROR, exc_info=sys.exc_info())
         TokenRedactingFilter().filter(record)
         assert self.SECRET not in (record.exc_text or "")
         assert "api_token=***" in (record.exc_text or "")
 
     def test_filter_redacts_url_embedded_in_message(self):
-        record = logging.LogRecord(
-            name="uvicorn.access",
-            level=logging.INFO,
-            pathname=__file__,
-            lineno=1,
-            msg=f"GET /mcp?api_token={self.SECRET} HTTP/1.1",
-            args=None,
-            exc_info=None,
-        )
+        record = _record(f"GET /mcp?api_token={self.SECRET} HTTP/1.1", name="uvicorn.access")
         TokenRedactingFilter().filter(record)
         assert self.SECRET not in record.getMessage()
         assert "api_token=***" in record.getMessage()
@@ -0,0 +1,94 @@
+# tests/auto/test_cache.py
+"""Tests for app.cache — TTL caching, singleflight, error passthrough.
+
+Covers:
+  - cached_request: miss fetches, hit skips the fetcher, expiry refetches
+  - error dicts are returned but never stored
+  - keys include the resolved api_token, so credentials don't share entries
+  - ttl=0 bypasses the cache
+  - concurrent misses collapse into a single upstream fetch
+  - clear_cache resets state
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import app.cache as cache
+from app.cache import cached_request, clear_cache
+
+URL = "https://eodhd.com/api/exchanges-list/?fmt=json"
+
+
+class TestCachedRequest:
+    async def test_miss_then_hit(self):
+        fetch = AsyncMock(return_value=[{"Code": "US"}])
+        first = await cached_request(URL, ttl=60, fetch=fetch)
+        second = await cached_request(URL, ttl=60, fetch=fetch)
+        assert first == second == [{"Code": "US"}]
+        assert fetch.await_count == 1
+
+    async def test_expired_entry_refetches(self, monkeypatch):
+        # Fake clock instead of sleeping through the TTL.
+        clock = [1000.0]
+        monkeypatch.setattr(cache, "_now", lambda: clock[0])
+        fetch = AsyncMock(return_value={"ok": 1})
+        await cached_request(URL, ttl=60, fetch=fetch)
+        clock[0] += 61
+        await cached_request(URL, ttl=60, fetch=fetch)
+        assert fetch.await_count == 2
+
+    async def test_entry_survives_within_ttl(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(cache, "_now", lambda: clock[0])
+        fetch = AsyncMock(return_value={"ok": 1})
+        await cached_request(URL, ttl=60, fetch=fetch)
+        clock[0] += 59
+        await cached_request(URL, ttl=60, fetch=fetch)
+        assert fetch.await_count == 1
+
+    async def test_error_dict_not_cached(self):
+        fetch = AsyncMock(return_value={"error": "Ticker Not Found", "status_code": 404})
+        result = await cached_request(URL, ttl=60, fetch=fetch)
+        assert result["error"] == "Ticker Not Found"
+        await cached_request(URL, ttl=60, fetch=fetch)
+        assert fetch.await_count == 2
+
+    async def test_error_result_does_not_leak_key_lock(self):
+        fetch = AsyncMock(return_value={"error": "Ticker Not Found", "status_code": 404})
+        await cached_request(URL, ttl=60, fetch=fetch)
+        assert not cache._key_locks
+
+    async def test_distinct_tokens_distinct_entries(self):
+        fetch = AsyncMock(side_effect=[{"who": "a"}, {"who": "b"}])
+        url_a = URL + "&api_token=token_a"
+        url_b = URL + "&api_token=token_b"
+        assert await cached_request(url_a, ttl=60, fetch=fetch) == {"who": "a"}
+        assert await cached_request(url_b, ttl=60, fetch=fetch) == {"who": "b"}
+        assert fetch.await_count == 2
+
+    async def test_zero_ttl_bypasses_cache(self):
+        fetch = AsyncMock(return_value={"ok": 1})
+        await cached_request(URL, ttl=0, fetch=fetch)
+        await cached_request(URL, ttl=0, fetch=fetch)
+        assert fetch.await_count == 2
+
+    async def test_concurrent_misses_fetch_once(self):
+        async def slow_fetch(url):
+            await asyncio.sleep(0.01)
+            return {"ok": 1}
+
+        fetch = AsyncMock(side_effect=slow_fetch)
+        results = await asyncio.gather(
+            cached_request(URL, ttl=60, fetch=fetch),
+            cached_request(URL, ttl=60, fetch=fetch),
+            cached_request(URL, ttl=60, fetch=fetch),
+        )
+        assert results == [{"ok": 1}] * 3
+        assert fetch.await_count == 1
+
+    async def test_clear_cache_forces_refetch(self):
+        fetch = AsyncMock(return_value={"ok": 1})
+        await cached_request(URL, ttl=60, fetch=fetch)
+        clear_cache()
+        await cached_request(URL, ttl=60, fetch=fetch)
+        assert fetch.await_count == 2
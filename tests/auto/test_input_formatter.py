@@ -13,6 +13,7 @@ import pytest
 from app.input_formatter import (
     _parse_to_datetime,
     _to_unix_seconds,
+    coerce_date_param,
     coerce_page_params,
     coerce_quarter_param,
     format_date,
@@ -444,6 +445,41 @@ class TestFormatDateYmd:
         assert "2024" in result
 
 
+# ---------------------------------------------------------------------------
+# coerce_date_param
+# ---------------------------------------------------------------------------
+
+
+class TestCoerceDateParam:
+    def test_none(self):
+        assert coerce_date_param(None) is None
+
+    def test_empty_string(self):
+        assert coerce_date_param("  ") is None
+
+    def test_canonical_ymd_passthrough(self):
+        assert coerce_date_param("2024-03-15") == "2024-03-15"
+
+    def test_leap_day_accepted(self):
+        assert coerce_date_param("2024-02-29") == "2024-02-29"
+
+    def test_non_leap_feb_29_rejected(self):
+        with pytest.raises(ToolError, match="start_date"):
+            coerce_date_param("2023-02-29", "start_date")
+
+    @pytest.mark.parametrize("value", ["2024-13-01", "2024-00-10", "2024-04-31", "2024-01-00"])
+    def test_out_of_range_components_rejected(self, value):
+        with pytest.raises(ToolError):
+            coerce_date_param(value)
+
+    def test_flexible_formats_still_coerced(self):
+        assert coerce_date_param("2024/03/15") == "2024-03-15"
+
+    def test_unparseable_raises_with_param_name(self):
+        with pytest.raises(ToolError, match="end_date"):
+            coerce_date_param("garbage", "end_date")
+
+
 # ---------------------------------------------------------------------------
 # format_date_unix
 # ---------------------------------------------------------------------------
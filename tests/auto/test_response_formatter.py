@@ -270,6 +270,15 @@ class TestFormatJsonResponse:
         text = result[0].resource.text
         assert "\n" in text  # indent=2 produces newlines
 
+    def test_compact_output_when_flag_set(self, monkeypatch):
+        import app.response_formatter as rf
+
+        monkeypatch.setattr(rf, "_JSON_OPTS", 0)
+        result = format_json_response({"a": 1, "b": [1, 2]})
+        text = result[0].resource.text
+        assert "\n" not in text
+        assert json.loads(text) == {"a": 1, "b": [1, 2]}
+
     def test_empty_dict(self):
         result = format_json_response({})
         parsed = json.loads(result[0].resource.text)